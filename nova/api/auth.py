@@ -95,13 +95,18 @@ class NovaKeystoneContext(wsgi.Middleware):
         remote_address = req.remote_addr
 
         service_catalog = None
-        if req.headers.get('X_SERVICE_CATALOG') is not None:
-            try:
-                catalog_header = req.headers.get('X_SERVICE_CATALOG')
-                service_catalog = jsonutils.loads(catalog_header)
-            except ValueError:
-                raise webob.exc.HTTPInternalServerError(
-                          _('Invalid service catalog json.'))
+        catalog_header = req.headers.get('X_SERVICE_CATALOG')
+        if catalog_header is not None:
+            # Requests from service users commonly carry an empty catalog;
+            # don't bother parsing that trivial case.
+            if catalog_header == '{}':
+                service_catalog = {}
+            else:
+                try:
+                    service_catalog = jsonutils.loads(catalog_header)
+                except ValueError:
+                    raise webob.exc.HTTPInternalServerError(
+                              _('Invalid service catalog json.'))
 
         # NOTE(jamielennox): This is a full auth plugin set by auth_token
         # middleware in newer versions.
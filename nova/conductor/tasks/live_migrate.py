@@ -12,6 +12,7 @@
 
 from oslo_log import log as logging
 import oslo_messaging as messaging
+from oslo_serialization import jsonutils
 from oslo_utils import excutils
 
 from nova import availability_zones
@@ -77,6 +78,9 @@ class LiveMigrationTask(base.TaskBase):
         self._source_cn = None
         self._held_allocations = None
         self.network_api = neutron.API()
+        # Compute node records looked up per host; the prechecks ask for the
+        # same host multiple times so avoid repeating the DB round trip.
+        self._compute_info_cache = {}
 
     def _execute(self):
         self._check_instance_is_active()
@@ -288,14 +292,10 @@ class LiveMigrationTask(base.TaskBase):
 
     def _check_requested_destination(self):
         """Performs basic pre-live migration checks for the forced host."""
-        # NOTE(gibi): This code path is used when the live migration is forced
-        # to a target host and skipping the scheduler. Such operation is
-        # rejected for servers with nested resource allocations since
-        # I7cbd5d9fb875ebf72995362e0b6693492ce32051. So here we can safely
-        # assume that the provider mapping is empty.
-        self._call_livem_checks_on_host(self.destination, {})
         # Make sure the forced destination host is in the same cell that the
-        # instance currently lives in.
+        # instance currently lives in. Do this before the other checks since
+        # it is just two cheap DB lookups, while the checks on the host cost
+        # a compute RPC round trip and possibly Neutron port bindings.
         # NOTE(mriedem): This can go away if/when the forced destination host
         # case calls select_destinations.
         source_cell_mapping = self._get_source_cell_mapping()
@@ -304,6 +304,12 @@ class LiveMigrationTask(base.TaskBase):
             raise exception.MigrationPreCheckError(
                 reason=(_('Unable to force live migrate instance %s '
                           'across cells.') % self.instance.uuid))
+        # NOTE(gibi): This code path is used when the live migration is forced
+        # to a target host and skipping the scheduler. Such operation is
+        # rejected for servers with nested resource allocations since
+        # I7cbd5d9fb875ebf72995362e0b6693492ce32051. So here we can safely
+        # assume that the provider mapping is empty.
+        self._call_livem_checks_on_host(self.destination, {})
 
     def _check_destination_is_not_source(self):
         if self.destination == self.source:
@@ -333,8 +339,11 @@ class LiveMigrationTask(base.TaskBase):
                     mem_inst=mem_inst))
 
     def _get_compute_info(self, host):
-        return objects.ComputeNode.get_first_node_by_host_for_old_compat(
-            self.context, host)
+        if host not in self._compute_info_cache:
+            self._compute_info_cache[host] = (
+                objects.ComputeNode.get_first_node_by_host_for_old_compat(
+                    self.context, host))
+        return self._compute_info_cache[host]
 
     def _check_compatible_with_source_hypervisor(self, destination):
         source_info = self._get_compute_info(self.source)
@@ -513,24 +522,33 @@ class LiveMigrationTask(base.TaskBase):
             attempted_hosts)
 
         host = None
+        # Alternate selections left over from the previous scheduler call;
+        # trying one of these on a rejected host saves a scheduler RPC.
+        selection_list = []
         while host is None:
             self._check_not_over_max_retries(attempted_hosts)
-            request_spec.ignore_hosts = attempted_hosts
-            try:
-                selection_lists = self.query_client.select_destinations(
-                        self.context, request_spec, [self.instance.uuid],
-                        return_objects=True, return_alternates=False)
-                # We only need the first item in the first list, as there is
-                # only one instance, and we don't care about any alternates.
-                selection = selection_lists[0][0]
-                host = selection.service_host
-            except messaging.RemoteError as ex:
-                # TODO(ShaoHe Feng) There maybe multi-scheduler, and the
-                # scheduling algorithm is R-R, we can let other scheduler try.
-                # Note(ShaoHe Feng) There are types of RemoteError, such as
-                # NoSuchMethod, UnsupportedVersion, we can distinguish it by
-                # ex.exc_type.
-                raise exception.MigrationSchedulerRPCError(reason=str(ex))
+            selection = self._get_claimed_alternate(
+                selection_list, attempted_hosts)
+            if selection is None:
+                request_spec.ignore_hosts = attempted_hosts
+                try:
+                    selection_lists = self.query_client.select_destinations(
+                            self.context, request_spec, [self.instance.uuid],
+                            return_objects=True, return_alternates=True)
+                    # We only need the first list, as there is only one
+                    # instance. The scheduler claimed resources for the first
+                    # selection in the list; keep the alternates around for
+                    # the next iteration in case this host is rejected.
+                    selection_list = list(selection_lists[0])
+                    selection = selection_list.pop(0)
+                except messaging.RemoteError as ex:
+                    # TODO(ShaoHe Feng) There maybe multi-scheduler, and the
+                    # scheduling algorithm is R-R, we can let other scheduler
+                    # try. Note(ShaoHe Feng) There are types of RemoteError,
+                    # such as NoSuchMethod, UnsupportedVersion, we can
+                    # distinguish it by ex.exc_type.
+                    raise exception.MigrationSchedulerRPCError(reason=str(ex))
+            host = selection.service_host
 
             scheduler_utils.fill_provider_mapping(request_spec, selection)
 
@@ -561,6 +579,39 @@ class LiveMigrationTask(base.TaskBase):
         # at this point.
         return (selection.service_host, selection.nodename, selection.limits)
 
+    def _get_claimed_alternate(self, selection_list, attempted_hosts):
+        """Gets a usable Selection from the prefetched scheduler alternates.
+
+        The scheduler only claims resources for the first selection it
+        returns; the remaining alternates may have been consumed by another
+        request in the meantime, so claim resources on one before handing it
+        out, the same way MigrationTask._reschedule does for cold migration.
+
+        :param selection_list: Remaining Selection objects from the previous
+            scheduler call, consumed from the front.
+        :param attempted_hosts: List of host names that were already rejected.
+        :returns: A Selection whose resources are claimed in placement, or
+            None if the list is exhausted.
+        """
+        elevated = self.context.elevated()
+        while selection_list:
+            selection = selection_list.pop(0)
+            if selection.service_host in attempted_hosts:
+                continue
+            if not selection.allocation_request:
+                # Some deployments use different schedulers that do not use
+                # Placement, so they will not have an allocation_request to
+                # claim with. For those cases, there is no concept of
+                # claiming, so just assume that the host is valid.
+                return selection
+            alloc_req = jsonutils.loads(selection.allocation_request)
+            if scheduler_utils.claim_resources(
+                    elevated, self.report_client, self.request_spec,
+                    self.instance.uuid, alloc_req,
+                    selection.allocation_request_version):
+                return selection
+        return None
+
     def _remove_host_allocations(self, compute_node_uuid):
         """Removes instance allocations against the given node from Placement
 
@@ -25,6 +25,9 @@ from nova import test
 
 CONF = nova.conf.CONF
 
+# Serialized once; every test only needs some well-formed catalog header.
+_EMPTY_SERVICE_CATALOG = jsonutils.dumps({})
+
 
 class TestNovaKeystoneContextMiddleware(test.NoDBTestCase):
 
@@ -41,7 +44,7 @@ class TestNovaKeystoneContextMiddleware(test.NoDBTestCase):
         self.request = webob.Request.blank('/')
         self.request.headers['X_TENANT_ID'] = 'testtenantid'
         self.request.headers['X_AUTH_TOKEN'] = 'testauthtoken'
-        self.request.headers['X_SERVICE_CATALOG'] = jsonutils.dumps({})
+        self.request.headers['X_SERVICE_CATALOG'] = _EMPTY_SERVICE_CATALOG
 
     def test_no_user_or_user_id(self):
         response = self.request.get_response(self.middleware)
@@ -59,6 +62,13 @@ class TestNovaKeystoneContextMiddleware(test.NoDBTestCase):
         response = self.request.get_response(self.middleware)
         self.assertEqual(response.status, '500 Internal Server Error')
 
+    def test_empty_service_catalog(self):
+        self.request.headers['X_USER_ID'] = 'testuser'
+        self.request.headers['X_SERVICE_CATALOG'] = '{}'
+        response = self.request.get_response(self.middleware)
+        self.assertEqual(response.status, '200 OK')
+        self.assertEqual([], self.context.service_catalog)
+
     def test_request_id_extracted_from_env(self):
         req_id = 'dummy-request-id'
         self.request.headers['X_PROJECT_ID'] = 'testtenantid'
@@ -70,9 +80,12 @@ class TestNovaKeystoneContextMiddleware(test.NoDBTestCase):
 
 class TestKeystoneMiddlewareRoles(test.NoDBTestCase):
 
-    def setUp(self):
-        super(TestKeystoneMiddlewareRoles, self).setUp()
+    @classmethod
+    def setUpClass(cls):
+        super(TestKeystoneMiddlewareRoles, cls).setUpClass()
 
+        # The app under the middleware is stateless so both can be built
+        # once for the whole class instead of once per test.
         @webob.dec.wsgify()
         def role_check_app(req):
             context = req.environ['nova.context']
@@ -84,12 +97,16 @@ class TestKeystoneMiddlewareRoles(test.NoDBTestCase):
             else:
                 raise webob.exc.HTTPBadRequest("unexpected role header")
 
-        self.middleware = nova.api.auth.NovaKeystoneContext(role_check_app)
+        cls.middleware = nova.api.auth.NovaKeystoneContext(role_check_app)
+
+    def setUp(self):
+        super(TestKeystoneMiddlewareRoles, self).setUp()
+
         self.request = webob.Request.blank('/')
         self.request.headers['X_USER_ID'] = 'testuser'
         self.request.headers['X_TENANT_ID'] = 'testtenantid'
         self.request.headers['X_AUTH_TOKEN'] = 'testauthtoken'
-        self.request.headers['X_SERVICE_CATALOG'] = jsonutils.dumps({})
+        self.request.headers['X_SERVICE_CATALOG'] = _EMPTY_SERVICE_CATALOG
 
         self.roles = "pawn, knight, rook"
 
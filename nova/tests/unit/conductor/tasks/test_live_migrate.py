@@ -317,6 +317,22 @@ class LiveMigrationTaskTestCase(test.NoDBTestCase):
                           self.task._check_destination_has_enough_memory)
         mock_get_first.assert_called_once_with(self.context, self.destination)
 
+    @mock.patch.object(objects.ComputeNode,
+                       'get_first_node_by_host_for_old_compat')
+    def test_get_compute_info_cached_per_host(self, mock_get_first):
+        mock_get_first.side_effect = [
+            objects.ComputeNode(host='source'),
+            objects.ComputeNode(host='dest')]
+
+        source_info = self.task._get_compute_info('source')
+        dest_info = self.task._get_compute_info('dest')
+        # Asking again for the same hosts must not hit the DB again.
+        self.assertIs(source_info, self.task._get_compute_info('source'))
+        self.assertIs(dest_info, self.task._get_compute_info('dest'))
+        self.assertEqual([mock.call(self.context, 'source'),
+                          mock.call(self.context, 'dest')],
+                         mock_get_first.call_args_list)
+
     @mock.patch.object(live_migrate.LiveMigrationTask, '_get_compute_info')
     def test_check_compatible_fails_with_hypervisor_diff(
         self, mock_get_info):
@@ -424,6 +440,9 @@ class LiveMigrationTaskTestCase(test.NoDBTestCase):
             ex = self.assertRaises(exception.MigrationPreCheckError,
                                    self.task._check_requested_destination)
         self.assertIn('across cells', str(ex))
+        # The cell check should fail fast, before the expensive RPC check
+        # on the destination host is made.
+        mock_check.assert_not_called()
 
     @mock.patch.object(live_migrate.LiveMigrationTask,
                        '_call_livem_checks_on_host')
@@ -451,7 +470,7 @@ class LiveMigrationTaskTestCase(test.NoDBTestCase):
         self.heal_reqspec_is_bfv_mock.assert_called_once_with(
             self.context, self.fake_spec, self.instance)
         mock_select.assert_called_once_with(self.context, self.fake_spec,
-            [self.instance.uuid], return_objects=True, return_alternates=False)
+            [self.instance.uuid], return_objects=True, return_alternates=True)
         mock_check.assert_called_once_with('host1')
         mock_call.assert_called_once_with('host1', {})
 
@@ -472,7 +491,7 @@ class LiveMigrationTaskTestCase(test.NoDBTestCase):
         mock_setup.assert_called_once_with(self.context, self.fake_spec)
         mock_select.assert_called_once_with(
             self.context, self.fake_spec, [self.instance.uuid],
-            return_objects=True, return_alternates=False)
+            return_objects=True, return_alternates=True)
         mock_check.assert_called_once_with('host1')
         mock_call.assert_called_once_with('host1', {})
 
@@ -497,9 +516,9 @@ class LiveMigrationTaskTestCase(test.NoDBTestCase):
         mock_setup.assert_called_once_with(self.context, self.fake_spec)
         mock_select.assert_has_calls([
             mock.call(self.context, self.fake_spec, [self.instance.uuid],
-                      return_objects=True, return_alternates=False),
+                      return_objects=True, return_alternates=True),
             mock.call(self.context, self.fake_spec, [self.instance.uuid],
-                      return_objects=True, return_alternates=False)])
+                      return_objects=True, return_alternates=True)])
         mock_check.assert_has_calls([mock.call('host1'), mock.call('host2')])
         mock_call.assert_called_once_with('host2', {})
 
@@ -532,9 +551,9 @@ class LiveMigrationTaskTestCase(test.NoDBTestCase):
         mock_setup.assert_called_once_with(self.context, self.fake_spec)
         mock_select.assert_has_calls([
             mock.call(self.context, self.fake_spec, [self.instance.uuid],
-                      return_objects=True, return_alternates=False),
+                      return_objects=True, return_alternates=True),
             mock.call(self.context, self.fake_spec, [self.instance.uuid],
-                      return_objects=True, return_alternates=False)])
+                      return_objects=True, return_alternates=True)])
         mock_check.assert_has_calls([mock.call('host1'), mock.call('host2')])
         mock_call.assert_has_calls(
             [mock.call('host1', {}), mock.call('host2', {})])
@@ -561,13 +580,81 @@ class LiveMigrationTaskTestCase(test.NoDBTestCase):
         mock_setup.assert_called_once_with(self.context, self.fake_spec)
         mock_select.assert_has_calls([
             mock.call(self.context, self.fake_spec, [self.instance.uuid],
-                      return_objects=True, return_alternates=False),
+                      return_objects=True, return_alternates=True),
             mock.call(self.context, self.fake_spec, [self.instance.uuid],
-                      return_objects=True, return_alternates=False)])
+                      return_objects=True, return_alternates=True)])
         mock_check.assert_has_calls([mock.call('host1'), mock.call('host2')])
         mock_call.assert_has_calls(
             [mock.call('host1', {}), mock.call('host2', {})])
 
+    @staticmethod
+    def _fake_alternate():
+        return objects.Selection(
+            service_host="host2", nodename="node2", cell_uuid=uuids.cell,
+            limits=fake_limits2, compute_node_uuid=uuids.compute_node2,
+            allocation_request=jsonutils.dumps({'allocations': {}}),
+            allocation_request_version='1.19')
+
+    @mock.patch.object(scheduler_utils, 'claim_resources', return_value=True)
+    @mock.patch.object(live_migrate.LiveMigrationTask,
+                       '_remove_host_allocations')
+    @mock.patch.object(live_migrate.LiveMigrationTask,
+                       '_call_livem_checks_on_host')
+    @mock.patch.object(live_migrate.LiveMigrationTask,
+                       '_check_compatible_with_source_hypervisor')
+    @mock.patch.object(query.SchedulerQueryClient, 'select_destinations')
+    @mock.patch.object(scheduler_utils, 'setup_instance_group')
+    def test_find_destination_retry_uses_prefetched_alternate(
+            self, mock_setup, mock_select, mock_check, mock_call, mock_remove,
+            mock_claim):
+        alternate = self._fake_alternate()
+        mock_select.return_value = [[fake_selection1, alternate]]
+        mock_check.side_effect = [exception.InvalidHypervisorType(), None]
+
+        self.assertEqual(("host2", "node2", fake_limits2),
+                         self.task._find_destination())
+        # The second host came from the prefetched alternates so only one
+        # scheduler RPC should have been made.
+        mock_select.assert_called_once_with(
+            self.context, self.fake_spec, [self.instance.uuid],
+            return_objects=True, return_alternates=True)
+        mock_remove.assert_called_once_with(fake_selection1.compute_node_uuid)
+        # The alternate was not claimed by the scheduler so the task has to
+        # claim it before using it.
+        mock_claim.assert_called_once_with(
+            mock.ANY, self.task.report_client, self.fake_spec,
+            self.instance.uuid, {'allocations': {}}, '1.19')
+        mock_check.assert_has_calls([mock.call('host1'), mock.call('host2')])
+        mock_call.assert_called_once_with('host2', {})
+
+    @mock.patch.object(scheduler_utils, 'claim_resources', return_value=False)
+    @mock.patch.object(live_migrate.LiveMigrationTask,
+                       '_remove_host_allocations')
+    @mock.patch.object(live_migrate.LiveMigrationTask,
+                       '_call_livem_checks_on_host')
+    @mock.patch.object(live_migrate.LiveMigrationTask,
+                       '_check_compatible_with_source_hypervisor')
+    @mock.patch.object(query.SchedulerQueryClient, 'select_destinations')
+    @mock.patch.object(scheduler_utils, 'setup_instance_group')
+    def test_find_destination_alternate_claim_fails(
+            self, mock_setup, mock_select, mock_check, mock_call, mock_remove,
+            mock_claim):
+        alternate = self._fake_alternate()
+        mock_select.side_effect = [[[fake_selection1, alternate]],
+                                   [[fake_selection2]]]
+        mock_check.side_effect = [exception.InvalidHypervisorType(), None]
+
+        self.assertEqual(("host2", "node2", fake_limits2),
+                         self.task._find_destination())
+        # The alternate could not be claimed anymore so the task had to go
+        # back to the scheduler for a fresh selection.
+        self.assertEqual(2, mock_select.call_count)
+        mock_claim.assert_called_once_with(
+            mock.ANY, self.task.report_client, self.fake_spec,
+            self.instance.uuid, {'allocations': {}}, '1.19')
+        mock_remove.assert_called_once_with(fake_selection1.compute_node_uuid)
+        mock_call.assert_called_once_with('host2', {})
+
     @mock.patch.object(objects.Migration, 'save')
     @mock.patch.object(live_migrate.LiveMigrationTask,
                        '_remove_host_allocations')
@@ -590,7 +677,7 @@ class LiveMigrationTaskTestCase(test.NoDBTestCase):
         mock_setup.assert_called_once_with(self.context, self.fake_spec)
         mock_select.assert_called_once_with(
             self.context, self.fake_spec, [self.instance.uuid],
-            return_objects=True, return_alternates=False)
+            return_objects=True, return_alternates=True)
         mock_check.assert_called_once_with('host1')
 
     @mock.patch.object(query.SchedulerQueryClient, 'select_destinations',
@@ -602,7 +689,7 @@ class LiveMigrationTaskTestCase(test.NoDBTestCase):
         mock_setup.assert_called_once_with(self.context, self.fake_spec)
         mock_select.assert_called_once_with(
             self.context, self.fake_spec, [self.instance.uuid],
-            return_objects=True, return_alternates=False)
+            return_objects=True, return_alternates=True)
 
     @mock.patch("nova.utils.get_image_from_system_metadata")
     @mock.patch("nova.scheduler.utils.build_request_spec")
@@ -798,7 +885,7 @@ class LiveMigrationTaskTestCase(test.NoDBTestCase):
         self.heal_reqspec_is_bfv_mock.assert_called_once_with(
             self.context, self.fake_spec, self.instance)
         mock_select.assert_called_once_with(self.context, self.fake_spec,
-            [self.instance.uuid], return_objects=True, return_alternates=False)
+            [self.instance.uuid], return_objects=True, return_alternates=True)
         mock_check.assert_called_once_with('host1')
         mock_call.assert_called_once_with('host1', {uuids.port_id: []})
         mock_fill_provider_mapping.assert_called_once_with(